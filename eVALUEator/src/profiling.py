@@ -0,0 +1,205 @@
+"""
+Opt-in profiling for validation runs
+
+Records timed phases (prompt building, agent steps, tool calls, parsing,
+saving) and writes each run as a Chrome trace JSON file, which can be
+opened in https://www.speedscope.app or chrome://tracing.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class ProfileRun:
+    """Timed events for one top-level validation run"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.events: List[Dict[str, Any]] = []
+        self.trace_path: Optional[Path] = None
+
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def record(self, name: str, category: str, start: float, end: float, **args):
+        """Record a completed phase from perf_counter() start/end times"""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = {k: str(v) for k, v in args.items()}
+
+        with self._lock:
+            self.events.append(event)
+
+    def to_chrome_trace(self) -> Dict:
+        """Return recorded events in Chrome trace event format"""
+        with self._lock:
+            events = sorted(self.events, key=lambda e: (e["ts"], -e["dur"]))
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"run": self.name},
+        }
+
+    def summary(self) -> List[Dict]:
+        """
+        Aggregate recorded events by name
+
+        Returns:
+            Rows with name, category, count, total/mean/max ms and share of
+            the run's wall time, slowest first
+        """
+        with self._lock:
+            events = list(self.events)
+
+        if not events:
+            return []
+
+        wall_us = max(e["ts"] + e["dur"] for e in events) - min(e["ts"] for e in events)
+
+        rows: Dict[tuple, Dict] = {}
+        for event in events:
+            key = (event["cat"], event["name"])
+            row = rows.setdefault(key, {
+                "name": event["name"],
+                "category": event["cat"],
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+            })
+            dur_ms = event["dur"] / 1000
+            row["count"] += 1
+            row["total_ms"] += dur_ms
+            row["max_ms"] = max(row["max_ms"], dur_ms)
+
+        for row in rows.values():
+            row["mean_ms"] = row["total_ms"] / row["count"]
+            row["percent"] = 100 * row["total_ms"] * 1000 / wall_us if wall_us else 0.0
+
+        return sorted(rows.values(), key=lambda r: r["total_ms"], reverse=True)
+
+    def format_summary(self) -> str:
+        """Format the summary as a plain-text table"""
+        header = f"{'Phase':<40} {'Cat':<6} {'Count':>5} {'Total ms':>10} {'Mean ms':>9} {'Max ms':>9} {'%Run':>6}"
+        lines = [header, "-" * len(header)]
+        for row in self.summary():
+            lines.append(
+                f"{row['name'][:40]:<40} {row['category'][:6]:<6} {row['count']:>5} "
+                f"{row['total_ms']:>10.1f} {row['mean_ms']:>9.1f} {row['max_ms']:>9.1f} "
+                f"{row['percent']:>5.1f}%"
+            )
+        return "\n".join(lines)
+
+    def save_trace(self, path: Path) -> Path:
+        """Write the run as a Chrome trace JSON file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+        self.trace_path = path
+        return path
+
+
+class Profiler:
+    """
+    Collects phase timings for validation runs
+
+    Phases may be nested. The outermost phase starts a run; when it ends,
+    the run's trace is written to output_dir and a summary table is
+    printed. Each thread or async task gets its own run, so overlapping
+    validations produce separate traces. When disabled, phase() does
+    nothing.
+    """
+
+    def __init__(self, enabled: bool = False, output_dir: Optional[str] = None):
+        """
+        Initialize the profiler
+
+        Args:
+            enabled: Whether to record timings
+            output_dir: Where to write trace files (default: profiles/)
+        """
+        self.enabled = enabled
+        self.output_dir = Path(output_dir or "profiles")
+        self.last_run: Optional[ProfileRun] = None
+
+        self._current_run: ContextVar[Optional[ProfileRun]] = ContextVar(
+            f"profiler_run_{id(self)}", default=None
+        )
+
+    @property
+    def current_run(self) -> Optional[ProfileRun]:
+        """The run in progress in this thread/task, if any"""
+        return self._current_run.get()
+
+    @contextmanager
+    def phase(self, name: str, category: str = "phase", **args):
+        """
+        Time a block of code as a named phase
+
+        Args:
+            name: Phase name shown in the trace and summary
+            category: Trace category (phase, agent, llm, tool)
+            **args: Extra details attached to the trace event
+        """
+        if not self.enabled:
+            yield
+            return
+
+        run = self._current_run.get()
+        token = None
+        if run is None:
+            run = ProfileRun(name)
+            token = self._current_run.set(run)
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            run.record(name, category, start, time.perf_counter(), **args)
+            if token is not None:
+                self._current_run.reset(token)
+                self._finish_run(run)
+
+    def callback_handler(self):
+        """Create a LangChain callback handler that records agent steps into the current run"""
+        from .profiling_callbacks import ProfilingCallbackHandler
+
+        return ProfilingCallbackHandler(self.current_run)
+
+    def trace_path_for(self, run: ProfileRun) -> Path:
+        """Default trace file path for a run: <output_dir>/<run>_<timestamp>.trace.json"""
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        run_name = re.sub(r"[^\w.-]+", "_", run.name, flags=re.ASCII).strip("_")
+        return self.output_dir / f"{run_name}_{stamp}.trace.json"
+
+    def _finish_run(self, run: ProfileRun):
+        """Write the trace and print the summary for a completed run"""
+        self.last_run = run
+
+        print(f"\n⏱  Profile for {run.name}")
+        print(run.format_summary())
+
+        try:
+            run.save_trace(self.trace_path_for(run))
+        except OSError as e:
+            print(f"   ⚠️  Could not save profile trace: {e}")
+        else:
+            print(f"   Trace saved to {run.trace_path}")
@@ -0,0 +1,71 @@
+"""
+LangChain callback handler for the opt-in profiler
+
+Kept separate from profiling.py so the timing and trace code can be used
+without the agent stack installed.
+"""
+
+import time
+from typing import Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from .profiling import ProfileRun
+
+
+class ProfilingCallbackHandler(BaseCallbackHandler):
+    """Records agent graph steps, model calls and tool calls into a ProfileRun"""
+
+    def __init__(self, run: Optional[ProfileRun]):
+        self.run = run
+        self._starts: Dict[UUID, tuple] = {}
+
+    def _start(self, run_id: UUID, name: str, category: str):
+        self._starts[run_id] = (name, category, time.perf_counter())
+
+    def _end(self, run_id: UUID, **args):
+        started = self._starts.pop(run_id, None)
+        if started is None or self.run is None:
+            return
+        name, category, start = started
+        self.run.record(name, category, start, time.perf_counter(), **args)
+
+    @staticmethod
+    def _name(serialized: Optional[Dict], kwargs: Dict, default: str) -> str:
+        if kwargs.get("name"):
+            return kwargs["name"]
+        if serialized:
+            return serialized.get("name") or (serialized.get("id") or [default])[-1]
+        return default
+
+    def on_chain_start(self, serialized, inputs, *, run_id, **kwargs):
+        self._start(run_id, self._name(serialized, kwargs, "chain"), "agent")
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error=repr(error))
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start(run_id, self._name(serialized, kwargs, "chat_model"), "llm")
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id, self._name(serialized, kwargs, "llm"), "llm")
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error=repr(error))
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        name = self._name(serialized, kwargs, "tool")
+        self._start(run_id, f"tool:{name}", "tool")
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error=repr(error))
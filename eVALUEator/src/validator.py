@@ -14,6 +14,7 @@ from deepagents.middleware import FilesystemMiddleware
 from langchain_anthropic import ChatAnthropic
 
 from .models.opportunity import Opportunity, ValidationResult, OpportunityScore, ResearchFindings
+from .profiling import Profiler
 
 
 class OpportunityValidator:
@@ -26,13 +27,21 @@ class OpportunityValidator:
     - Comparison (ranking multiple opportunities)
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = None,
+        profile: Optional[bool] = None,
+        profile_dir: Optional[str] = None
+    ):
         """
         Initialize the validator
         
         Args:
             api_key: Anthropic API key (or set ANTHROPIC_API_KEY env var)
             model: Claude model to use (default: claude-sonnet-4-20250514)
+            profile: Record per-phase timings for each run (or set VALIDATION_PROFILE=1)
+            profile_dir: Where to write trace files (or set VALIDATION_PROFILE_DIR, default: profiles/)
         """
         # Load environment variables
         load_dotenv()
@@ -48,6 +57,14 @@ class OpportunityValidator:
         # Set model
         model_name = model or os.getenv("VALIDATION_MODEL", "claude-sonnet-4-20250514")
         
+        # Opt-in profiling
+        if profile is None:
+            profile = os.getenv("VALIDATION_PROFILE", "").lower() in ("1", "true", "yes")
+        self.profiler = Profiler(
+            enabled=profile,
+            output_dir=profile_dir or os.getenv("VALIDATION_PROFILE_DIR")
+        )
+        
         # Create hybrid storage backend
         # /opportunities/ directory persists across runs
         backend = CompositeBackend(
@@ -70,6 +87,8 @@ class OpportunityValidator:
         )
         
         print(f"✓ OpportunityValidator initialized with {model_name}")
+        if profile:
+            print(f"   Profiling enabled (traces in {self.profiler.output_dir}/)")
     
     def validate_opportunity(
         self, 
@@ -88,27 +107,29 @@ class OpportunityValidator:
         """
         opp = Opportunity(**opportunity)
         
-        print(f"\n🔍 Validating: {opp.name}")
-        print(f"   ICP: {opp.icp}")
-        print(f"   Problem: {opp.problem}")
-        
-        # Build validation request
-        request = self._build_validation_request(opp, research_focus)
-        
-        # Run agent
-        result = self.agent.invoke({
-            "messages": [{"role": "user", "content": request}]
-        })
-        
-        # Parse results
-        validation_result = self._parse_validation_result(opp, result)
-        
-        # Save to file system
-        self._save_result(validation_result)
-        
-        print(f"✓ Validation complete for {opp.name}")
-        print(f"   Score: {validation_result.score.total_score}/120")
-        print(f"   Recommendation: {validation_result.score.recommendation}")
+        with self.profiler.phase(f"validate_opportunity: {opp.name}"):
+            print(f"\n🔍 Validating: {opp.name}")
+            print(f"   ICP: {opp.icp}")
+            print(f"   Problem: {opp.problem}")
+            
+            # Build validation request
+            with self.profiler.phase("build_validation_request"):
+                request = self._build_validation_request(opp, research_focus)
+            
+            # Run agent
+            result = self._invoke_agent(request)
+            
+            # Parse results
+            with self.profiler.phase("parse_validation_result"):
+                validation_result = self._parse_validation_result(opp, result)
+            
+            # Save to file system
+            with self.profiler.phase("save_result"):
+                self._save_result(validation_result)
+            
+            print(f"✓ Validation complete for {opp.name}")
+            print(f"   Score: {validation_result.score.total_score}/120")
+            print(f"   Recommendation: {validation_result.score.recommendation}")
         
         return validation_result
     
@@ -129,24 +150,25 @@ class OpportunityValidator:
         """
         print(f"\n📊 Validating {len(opportunities)} opportunities{'in parallel' if parallel else 'sequentially'}...")
         
-        if parallel:
-            # Build batch request for parallel processing
-            request = self._build_batch_request(opportunities)
-            
-            result = self.agent.invoke({
-                "messages": [{"role": "user", "content": request}]
-            })
+        with self.profiler.phase("validate_opportunities", parallel=parallel, count=len(opportunities)):
+            if parallel:
+                # Build batch request for parallel processing
+                with self.profiler.phase("build_batch_request"):
+                    request = self._build_batch_request(opportunities)
+                
+                result = self._invoke_agent(request)
+                
+                # Parse results for all opportunities
+                with self.profiler.phase("parse_batch_results"):
+                    results = self._parse_batch_results(opportunities, result)
+            else:
+                # Sequential validation
+                results = [
+                    self.validate_opportunity(opp) 
+                    for opp in opportunities
+                ]
             
-            # Parse results for all opportunities
-            results = self._parse_batch_results(opportunities, result)
-        else:
-            # Sequential validation
-            results = [
-                self.validate_opportunity(opp) 
-                for opp in opportunities
-            ]
-        
-        print(f"\n✓ All validations complete")
+            print(f"\n✓ All validations complete")
         return results
     
     def compare_opportunities(self, results: List[ValidationResult]) -> Dict:
@@ -161,15 +183,16 @@ class OpportunityValidator:
         """
         print(f"\n⚖️  Comparing {len(results)} opportunities...")
         
-        # Build comparison request
-        request = self._build_comparison_request(results)
-        
-        result = self.agent.invoke({
-            "messages": [{"role": "user", "content": request}]
-        })
-        
-        # Extract comparison from result
-        comparison = self._parse_comparison_result(result)
+        with self.profiler.phase("compare_opportunities", count=len(results)):
+            # Build comparison request
+            with self.profiler.phase("build_comparison_request"):
+                request = self._build_comparison_request(results)
+            
+            result = self._invoke_agent(request)
+            
+            # Extract comparison from result
+            with self.profiler.phase("parse_comparison_result"):
+                comparison = self._parse_comparison_result(result)
         
         # Print summary
         print("\n" + "="*60)
@@ -201,6 +224,18 @@ class OpportunityValidator:
         
         return next(r for r in results if r.opportunity.name == top_opportunity_name)
     
+    def _invoke_agent(self, request: str):
+        """Run the orchestrator agent, recording graph steps and tool calls when profiling"""
+        with self.profiler.phase("agent.invoke"):
+            config = {}
+            if self.profiler.enabled:
+                config["callbacks"] = [self.profiler.callback_handler()]
+            
+            return self.agent.invoke(
+                {"messages": [{"role": "user", "content": request}]},
+                config=config or None
+            )
+    
     def _build_validation_request(self, opp: Opportunity, focus: Optional[List[str]]) -> str:
         """Build the validation request for an opportunity"""
         request = f"""
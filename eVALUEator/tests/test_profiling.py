@@ -0,0 +1,126 @@
+"""
+Tests for the opt-in Profiler
+
+Run with: python -m pytest tests/
+"""
+
+import json
+import threading
+
+import pytest
+from src.profiling import Profiler
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    """Test that phases are no-ops when profiling is off"""
+    profiler = Profiler(enabled=False, output_dir=str(tmp_path))
+
+    with profiler.phase("run"):
+        with profiler.phase("step"):
+            assert profiler.current_run is None
+
+    assert profiler.last_run is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_run_writes_chrome_trace(tmp_path):
+    """Test that finishing the outermost phase writes a trace file"""
+    profiler = Profiler(enabled=True, output_dir=str(tmp_path))
+
+    with profiler.phase("validate_opportunity: Test"):
+        with profiler.phase("build_validation_request"):
+            pass
+        with profiler.phase("save_result"):
+            pass
+
+    run = profiler.last_run
+    assert run.trace_path is not None
+    with open(run.trace_path) as f:
+        trace = json.load(f)
+
+    names = [e["name"] for e in trace["traceEvents"]]
+    assert names == ["validate_opportunity: Test", "build_validation_request", "save_result"]
+    assert all(e["ph"] == "X" for e in trace["traceEvents"])
+    assert profiler.current_run is None
+
+
+def test_summary_aggregates_by_name(tmp_path):
+    """Test that repeated phases are counted together"""
+    profiler = Profiler(enabled=True, output_dir=str(tmp_path))
+
+    with profiler.phase("run"):
+        for _ in range(3):
+            with profiler.phase("parse"):
+                pass
+
+    rows = {row["name"]: row for row in profiler.last_run.summary()}
+    assert rows["parse"]["count"] == 3
+    assert rows["run"]["count"] == 1
+    assert "parse" in profiler.last_run.format_summary()
+
+
+def test_concurrent_runs_get_separate_traces(tmp_path):
+    """Test that overlapping runs in different threads are not merged"""
+    profiler = Profiler(enabled=True, output_dir=str(tmp_path))
+    barrier = threading.Barrier(2)
+
+    def work(i):
+        with profiler.phase(f"run {i}"):
+            barrier.wait()
+            with profiler.phase(f"step {i}"):
+                barrier.wait()
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    traces = sorted(tmp_path.glob("*.trace.json"))
+    assert len(traces) == 2
+    for path in traces:
+        with open(path) as f:
+            trace = json.load(f)
+        i = trace["otherData"]["run"].split()[-1]
+        assert [e["name"] for e in trace["traceEvents"]] == [f"run {i}", f"step {i}"]
+
+
+def test_trace_filename_is_portable(tmp_path):
+    """Test that run names are reduced to filesystem-safe characters"""
+    profiler = Profiler(enabled=True, output_dir=str(tmp_path))
+
+    with profiler.phase('validate_opportunity: A/B \\ "C"? <d>|*'):
+        pass
+
+    filename = profiler.last_run.trace_path.name
+    assert filename.startswith("validate_opportunity_A_B_C_d_")
+    assert all(c.isalnum() or c in "._-" for c in filename)
+
+
+def test_trace_write_failure_does_not_raise(tmp_path, capsys):
+    """Test that an unwritable output dir only prints a warning"""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    profiler = Profiler(enabled=True, output_dir=str(blocker))
+
+    with profiler.phase("run"):
+        result = 42
+
+    assert result == 42
+    assert profiler.last_run.trace_path is None
+    assert "Could not save profile trace" in capsys.readouterr().out
+
+
+def test_trace_write_failure_keeps_original_error(tmp_path):
+    """Test that a failing run still raises its own exception"""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    profiler = Profiler(enabled=True, output_dir=str(blocker))
+
+    with pytest.raises(ValueError, match="boom"):
+        with profiler.phase("run"):
+            raise ValueError("boom")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
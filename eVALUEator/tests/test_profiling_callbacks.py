@@ -0,0 +1,89 @@
+"""
+Tests for the profiling LangChain callback handler
+
+Run with: python -m pytest tests/
+"""
+
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from src.profiling import ProfileRun
+from src.profiling_callbacks import ProfilingCallbackHandler
+
+
+def _events(run):
+    return {e["name"]: e for e in run.events}
+
+
+def test_name_resolution_order():
+    """Test that kwargs name wins, then serialized name, then last id part"""
+    run = ProfileRun("run")
+    handler = ProfilingCallbackHandler(run)
+    ids = [uuid4() for _ in range(4)]
+
+    handler.on_chain_start({"name": "serialized"}, {}, run_id=ids[0], name="from_kwargs")
+    handler.on_chain_start({"name": "serialized"}, {}, run_id=ids[1])
+    handler.on_chain_start({"id": ["langgraph", "graph", "Pregel"]}, {}, run_id=ids[2])
+    handler.on_chain_start(None, {}, run_id=ids[3])
+    for run_id in ids:
+        handler.on_chain_end({}, run_id=run_id)
+
+    assert set(_events(run)) == {"from_kwargs", "serialized", "Pregel", "chain"}
+    assert all(e["cat"] == "agent" for e in run.events)
+
+
+def test_start_and_end_paired_by_run_id():
+    """Test that interleaved events are matched by run_id"""
+    run = ProfileRun("run")
+    handler = ProfilingCallbackHandler(run)
+    outer, inner = uuid4(), uuid4()
+
+    handler.on_chat_model_start({}, [], run_id=outer, name="outer")
+    handler.on_llm_start({}, [], run_id=inner, name="inner")
+    handler.on_llm_end(None, run_id=inner)
+    handler.on_llm_end(None, run_id=outer)
+    handler.on_llm_end(None, run_id=uuid4())  # unknown run_id is ignored
+
+    events = _events(run)
+    assert len(run.events) == 2
+    assert events["outer"]["dur"] >= events["inner"]["dur"]
+    assert events["outer"]["cat"] == events["inner"]["cat"] == "llm"
+
+
+def test_tool_events_are_prefixed():
+    """Test that tool calls are named tool:<name>"""
+    run = ProfileRun("run")
+    handler = ProfilingCallbackHandler(run)
+    run_id = uuid4()
+
+    handler.on_tool_start({"name": "write_file"}, "{}", run_id=run_id)
+    handler.on_tool_end("ok", run_id=run_id)
+
+    event = _events(run)["tool:write_file"]
+    assert event["cat"] == "tool"
+
+
+def test_error_events_carry_error():
+    """Test that *_error callbacks close the phase with an error arg"""
+    run = ProfileRun("run")
+    handler = ProfilingCallbackHandler(run)
+    chain_id, llm_id, tool_id = uuid4(), uuid4(), uuid4()
+
+    handler.on_chain_start({}, {}, run_id=chain_id, name="agent")
+    handler.on_llm_start({}, [], run_id=llm_id, name="model")
+    handler.on_tool_start({}, "", run_id=tool_id, name="search")
+    handler.on_tool_error(RuntimeError("tool failed"), run_id=tool_id)
+    handler.on_llm_error(RuntimeError("llm failed"), run_id=llm_id)
+    handler.on_chain_error(RuntimeError("chain failed"), run_id=chain_id)
+
+    events = _events(run)
+    assert "tool failed" in events["tool:search"]["args"]["error"]
+    assert "llm failed" in events["model"]["args"]["error"]
+    assert "chain failed" in events["agent"]["args"]["error"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -68,5 +68,69 @@ def test_efficiency_score_with_zero_market():
     assert score.efficiency_score == 83.0  # 83 / (0 + 1)
 
 
+class FakeAgent:
+    """Stands in for the deep agent, recording the config it was invoked with"""
+    
+    def __init__(self):
+        self.configs = []
+    
+    def invoke(self, inputs, config=None):
+        self.configs.append(config)
+        return {"messages": []}
+
+
+def _make_validator(profile, tmp_path, monkeypatch):
+    """Build a validator with a fake agent, skipping API key and model setup"""
+    pytest.importorskip("deepagents")
+    from src.validator import OpportunityValidator
+    from src.profiling import Profiler
+    
+    monkeypatch.chdir(tmp_path)
+    validator = OpportunityValidator.__new__(OpportunityValidator)
+    validator.agent = FakeAgent()
+    validator.profiler = Profiler(enabled=profile, output_dir=str(tmp_path / "profiles"))
+    return validator
+
+
+SAMPLE_OPPORTUNITY = {
+    "name": "Test Opportunity",
+    "description": "A test opportunity",
+    "icp": "Test users",
+    "problem": "Test problem"
+}
+
+
+def test_validate_opportunity_profiling_phases(tmp_path, monkeypatch):
+    """Test that a profiled validation records each pipeline phase"""
+    validator = _make_validator(True, tmp_path, monkeypatch)
+    
+    validator.validate_opportunity(SAMPLE_OPPORTUNITY)
+    
+    names = [e["name"] for e in validator.profiler.last_run.to_chrome_trace()["traceEvents"]]
+    assert names == [
+        "validate_opportunity: Test Opportunity",
+        "build_validation_request",
+        "agent.invoke",
+        "parse_validation_result",
+        "save_result",
+    ]
+    assert validator.profiler.last_run.trace_path.exists()
+    
+    callbacks = validator.agent.configs[0]["callbacks"]
+    assert len(callbacks) == 1
+    assert callbacks[0].run is validator.profiler.last_run
+
+
+def test_validate_opportunity_without_profiling(tmp_path, monkeypatch):
+    """Test that the agent gets no callbacks and no traces are written when profiling is off"""
+    validator = _make_validator(False, tmp_path, monkeypatch)
+    
+    validator.validate_opportunity(SAMPLE_OPPORTUNITY)
+    
+    assert validator.agent.configs == [None]
+    assert validator.profiler.last_run is None
+    assert not (tmp_path / "profiles").exists()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])